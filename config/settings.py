@@ -1,8 +1,25 @@
+import os
 from datetime import timedelta
 
 # Scheduling parameters
 DEFAULT_HORIZON_MINUTES = 1440  # 24 hours
 DEFAULT_OPTIMIZATION_TIMEOUT = 60  # seconds
+DEFAULT_NUM_WORKERS = os.cpu_count() or 8  # CP-SAT parallel search workers
+
+# CP-SAT parameter sets raced by ProductionScheduler.tune()
+TUNING_PORTFOLIO = [
+    {},  # solver defaults
+    {'linearization_level': 0},
+    {'linearization_level': 2},
+    {'cp_model_probing_level': 0},
+    {'cp_model_probing_level': 3},
+    {'optimize_with_core': True},
+    {'use_phase_saving': False},
+    {'linearization_level': 2, 'optimize_with_core': True}
+]
+
+# Heuristics
+NUMBA_MIN_OPERATIONS = 100  # smallest problem worth JIT-compiling the greedy heuristic for
 
 # Operation durations (minutes)
 OPERATION_DURATIONS = {
@@ -1,17 +1,17 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import Dict, FrozenSet, Tuple
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Job:
     job_id: str
-    operations: List[str]
+    operations: Tuple[str, ...]
     due_date: datetime
     priority: int
     release_date: datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Machine:
     machine_id: str
-    capabilities: List[str]
+    capabilities: FrozenSet[str]
     efficiency_factor: float
\ No newline at end of file
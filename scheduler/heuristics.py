@@ -0,0 +1,78 @@
+from typing import Tuple
+import numpy as np
+from config.settings import NUMBA_MIN_OPERATIONS
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, fall back to plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True)
+def _greedy_kernel(op_durations: np.ndarray, job_ops: np.ndarray,
+                   order: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """Earliest-finish list scheduling on integer arrays"""
+    n_jobs, max_ops = job_ops.shape
+    n_machines = op_durations.shape[1]
+    machine_free = np.zeros(n_machines, dtype=np.int64)
+    assigned = np.full((n_jobs, max_ops), -1, dtype=np.int64)
+    starts = np.zeros((n_jobs, max_ops), dtype=np.int64)
+
+    for job in order:
+        job_ready = 0
+        for op_idx in range(max_ops):
+            op_type = job_ops[job, op_idx]
+            if op_type < 0:
+                break
+
+            best_machine = -1
+            best_start = 0
+            best_end = 0
+            for machine in range(n_machines):
+                duration = op_durations[op_type, machine]
+                if duration < 0:
+                    continue
+                start = max(job_ready, machine_free[machine])
+                end = start + duration
+                if best_machine < 0 or end < best_end:
+                    best_machine = machine
+                    best_start = start
+                    best_end = end
+
+            if best_machine < 0:
+                return assigned, starts, False
+
+            assigned[job, op_idx] = best_machine
+            starts[job, op_idx] = best_start
+            machine_free[best_machine] = best_end
+            job_ready = best_end
+
+    return assigned, starts, True
+
+def greedy_list_schedule(op_durations: np.ndarray, job_ops: np.ndarray,
+                         order: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Schedule jobs greedily, placing each operation on the machine where it finishes earliest
+
+    Args:
+        op_durations: (operation types x machines) durations, -1 if incompatible
+        job_ops: (jobs x max operations) operation type indices, padded with -1
+        order: Job indices in the order they are scheduled
+
+    Returns:
+        Tuple of the assigned machine index and start time of every operation,
+        and whether every operation could be assigned
+    """
+    n_operations = int(np.count_nonzero(job_ops >= 0))
+    if NUMBA_AVAILABLE and n_operations >= NUMBA_MIN_OPERATIONS:
+        kernel = _greedy_kernel
+    else:
+        # Small problems do not pay back the one-time compilation
+        kernel = getattr(_greedy_kernel, 'py_func', _greedy_kernel)
+    return kernel(op_durations, job_ops, order)
@@ -1,238 +1,530 @@
 from ortools.sat.python import cp_model
 import logging
+import numpy as np
+import threading
+from collections import defaultdict
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 from models.data_models import Job, Machine
+from scheduler.heuristics import greedy_list_schedule
 from utils.helpers import get_operation_duration
-from config.settings import DEFAULT_HORIZON_MINUTES, DEFAULT_OPTIMIZATION_TIMEOUT
+from config.settings import (
+    DEFAULT_HORIZON_MINUTES,
+    DEFAULT_OPTIMIZATION_TIMEOUT,
+    DEFAULT_NUM_WORKERS,
+    TUNING_PORTFOLIO
+)
 
 logger = logging.getLogger(__name__)
 
 class ProductionScheduler:
-    def __init__(self, horizon_minutes: int = DEFAULT_HORIZON_MINUTES):
-        """Initialize the production scheduler"""
+    def __init__(self, horizon_minutes: int = DEFAULT_HORIZON_MINUTES,
+                 num_workers: int = DEFAULT_NUM_WORKERS,
+                 log_progress: bool = False,
+                 random_seed: Optional[int] = None,
+                 relative_gap_limit: Optional[float] = None,
+                 warm_start: bool = True,
+                 sat_params: Optional[Dict] = None):
+        """
+        Initialize the production scheduler
+        
+        Args:
+            horizon_minutes: Scheduling horizon in minutes
+            num_workers: Number of parallel CP-SAT search workers
+            log_progress: Log the CP-SAT search progress
+            random_seed: Seed for the solver, for reproducible runs
+            relative_gap_limit: Stop once the solution is within this relative
+                gap of the best bound (e.g. 0.01 for 1%)
+            warm_start: Hint the solver with a greedy list schedule
+            sat_params: Additional CP-SAT parameters by name, e.g.
+                {'cp_model_presolve': False}. The most impactful ones are
+                cp_model_presolve, cp_model_probing_level, linearization_level,
+                optimize_with_core, minimize_core, search_branching,
+                use_branching_in_lp, boolean_encoding_level and use_phase_saving
+        """
         self.horizon = horizon_minutes
+        self.num_workers = num_workers
+        self.log_progress = log_progress
+        self.random_seed = random_seed
+        self.relative_gap_limit = relative_gap_limit
+        self.warm_start = warm_start
+        self.sat_params = sat_params or {}
         self.jobs: List[Job] = []
         self.machines: List[Machine] = []
+        # Compatible (machine_idx, machine) pairs per operation and
+        # machine-specific durations, rebuilt with each model
+        self._compat: Dict[str, List[Tuple[int, Machine]]] = {}
+        self._durations: Dict[Tuple[str, int], int] = {}
+        # Last built model with its variables, keyed on the problem definition
+        self._model_cache: Optional[Tuple[Tuple, Tuple]] = None
         
     def add_job(self, job: Job):
         """Add a job to the scheduling problem"""
+        job = replace(job, operations=tuple(job.operations))
         self.jobs.append(job)
         logger.info(f"Added job {job.job_id} with {len(job.operations)} operations")
 
     def add_machine(self, machine: Machine):
         """Add a machine to the scheduling problem"""
+        machine = replace(machine, capabilities=frozenset(machine.capabilities))
         self.machines.append(machine)
-        logger.info(f"Added machine {machine.machine_id} with capabilities: {machine.capabilities}")
+        logger.info(f"Added machine {machine.machine_id} with capabilities: "
+                    f"{sorted(machine.capabilities)}")
 
-    def _create_variables(self, model: cp_model.CpModel) -> Tuple[Dict, Dict, Dict, Dict]:
-        """Create all necessary variables for the optimization model"""
-        job_starts = {}
-        job_ends = {}
+    def _create_variables(self, model: cp_model.CpModel) -> Tuple[Dict, Dict, Dict, Dict, Dict]:
+        """
+        Create all necessary variables for the optimization model
+        
+        Variables are keyed on (job_idx, op_idx) and (job_idx, op_idx, machine_idx),
+        positions in self.jobs and self.machines.
+        """
         job_intervals = {}
         job_machines = {}
+        op_starts = {}
+        op_ends = {}
+        op_machines = {}
         
-        # For each job, operation, and compatible machine
-        for job in self.jobs:
+        # For each job and operation
+        for job_idx, job in enumerate(self.jobs):
             for op_idx, operation in enumerate(job.operations):
-                # Find compatible machines
-                compatible_machines = [m for m in self.machines if operation in m.capabilities]
-                if not compatible_machines:
-                    logger.error(f"No compatible machine for operation {operation} of job {job.job_id}")
-                    continue
+                compatible_machines = self._compat[operation]
+                op_suffix = f'{job.job_id}_{op_idx}'
+                
+                # Calculate durations based on machine efficiency
+                durations = [self._durations[operation, machine_idx]
+                             for machine_idx, _ in compatible_machines]
                 
-                # Create variables for each possible machine assignment
-                for machine in compatible_machines:
+                # Operation timing, independent of the chosen machine
+                op_start = model.NewIntVar(0, self.horizon, f'op_start_{op_suffix}')
+                op_end = model.NewIntVar(0, self.horizon, f'op_end_{op_suffix}')
+                op_duration = model.NewIntVar(min(durations), max(durations),
+                                              f'op_duration_{op_suffix}')
+                
+                # Index of the chosen machine in compatible_machines selects the duration
+                op_machine = model.NewIntVar(0, len(compatible_machines) - 1,
+                                             f'op_machine_{op_suffix}')
+                model.AddElement(op_machine, durations, op_duration)
+                
+                # Enforces op_start + op_duration == op_end
+                model.NewIntervalVar(op_start, op_duration, op_end, f'op_interval_{op_suffix}')
+                
+                # Create an optional interval per machine for the no-overlap constraints
+                for compat_idx, (machine_idx, machine) in enumerate(compatible_machines):
                     suffix = f'{job.job_id}_{op_idx}_{machine.machine_id}'
                     
                     # Create presence variable (indicates if operation is assigned to this machine)
                     presence = model.NewBoolVar(f'presence_{suffix}')
+                    model.Add(op_machine == compat_idx).OnlyEnforceIf(presence)
+                    model.Add(op_machine != compat_idx).OnlyEnforceIf(presence.Not())
                     
-                    # Start time variable
-                    start = model.NewIntVar(0, self.horizon, f'start_{suffix}')
-                    
-                    # Calculate duration based on machine efficiency
-                    duration = self._calculate_operation_duration(operation, machine)
-                    
-                    # End time variable
-                    end = model.NewIntVar(0, self.horizon, f'end_{suffix}')
-                    
-                    # Interval variable
-                    interval = model.NewOptionalIntervalVar(
-                        start, duration, end, presence,
+                    # Fixed-size interval, op_end follows from the operation interval
+                    interval = model.NewOptionalFixedSizeIntervalVar(
+                        op_start, durations[compat_idx], presence,
                         f'interval_{suffix}'
                     )
                     
                     # Store all variables
-                    job_starts[job.job_id, op_idx, machine.machine_id] = start
-                    job_ends[job.job_id, op_idx, machine.machine_id] = end
-                    job_intervals[job.job_id, op_idx, machine.machine_id] = interval
-                    job_machines[job.job_id, op_idx, machine.machine_id] = presence
+                    job_intervals[job_idx, op_idx, machine_idx] = interval
+                    job_machines[job_idx, op_idx, machine_idx] = presence
+                
+                op_starts[job_idx, op_idx] = op_start
+                op_ends[job_idx, op_idx] = op_end
+                op_machines[job_idx, op_idx] = op_machine
         
-        return job_starts, job_ends, job_intervals, job_machines
+        return job_intervals, job_machines, op_starts, op_ends, op_machines
 
     def _add_constraints(self, model: cp_model.CpModel, 
-                        job_starts: Dict, job_ends: Dict, 
-                        job_intervals: Dict, job_machines: Dict):
+                        job_intervals: Dict, job_machines: Dict,
+                        op_starts: Dict, op_ends: Dict):
         """Add all necessary constraints to the model"""
         
         # 1. Each operation must be assigned to exactly one machine
         self._add_assignment_constraints(model, job_machines)
         
         # 2. Operations within each job must be sequential
-        self._add_precedence_constraints(model, job_starts, job_ends, job_machines)
+        self._add_precedence_constraints(model, op_starts, op_ends)
         
         # 3. No overlapping operations on machines
         self._add_resource_constraints(model, job_intervals)
         
-        # 4. Release time constraints
-        self._add_time_constraints(model, job_starts, job_machines)
+        # 4. Break symmetry between interchangeable machines
+        self._add_symmetry_breaking_constraints(model, job_machines)
 
     def _add_assignment_constraints(self, model: cp_model.CpModel, job_machines: Dict):
         """Ensure each operation is assigned to exactly one machine"""
-        for job in self.jobs:
+        for job_idx, job in enumerate(self.jobs):
             for op_idx, operation in enumerate(job.operations):
-                compatible_machines = [m for m in self.machines if operation in m.capabilities]
+                compatible_machines = self._compat[operation]
                 model.Add(
-                    sum(job_machines[job.job_id, op_idx, m.machine_id] 
-                        for m in compatible_machines) == 1
+                    sum(job_machines[job_idx, op_idx, machine_idx]
+                        for machine_idx, _ in compatible_machines) == 1
                 )
 
     def _add_precedence_constraints(self, model: cp_model.CpModel, 
-                                  job_starts: Dict, job_ends: Dict, 
-                                  job_machines: Dict):
+                                  op_starts: Dict, op_ends: Dict):
         """Ensure operations within each job are performed in sequence"""
-        for job in self.jobs:
+        for job_idx, job in enumerate(self.jobs):
             for op_idx in range(len(job.operations) - 1):
-                current_op = job.operations[op_idx]
-                next_op = job.operations[op_idx + 1]
-                
-                current_machines = [m for m in self.machines if current_op in m.capabilities]
-                next_machines = [m for m in self.machines if next_op in m.capabilities]
-                
-                for m1 in current_machines:
-                    for m2 in next_machines:
-                        model.Add(
-                            job_ends[job.job_id, op_idx, m1.machine_id] <=
-                            job_starts[job.job_id, op_idx + 1, m2.machine_id]
-                        ).OnlyEnforceIf([
-                            job_machines[job.job_id, op_idx, m1.machine_id],
-                            job_machines[job.job_id, op_idx + 1, m2.machine_id]
-                        ])
+                model.Add(
+                    op_ends[job_idx, op_idx] <= op_starts[job_idx, op_idx + 1]
+                )
 
     def _add_resource_constraints(self, model: cp_model.CpModel, job_intervals: Dict):
         """Ensure no machine is processing multiple operations simultaneously"""
-        for machine in self.machines:
-            machine_intervals = []
-            for job in self.jobs:
-                for op_idx, operation in enumerate(job.operations):
-                    if operation in machine.capabilities:
-                        machine_intervals.append(
-                            job_intervals[job.job_id, op_idx, machine.machine_id]
-                        )
-            model.AddNoOverlap(machine_intervals)
+        machine_intervals = [[] for _ in self.machines]
+        for (job_idx, op_idx, machine_idx), interval in job_intervals.items():
+            machine_intervals[machine_idx].append(interval)
+        
+        for intervals in machine_intervals:
+            model.AddNoOverlap(intervals)
 
-    def _add_time_constraints(self, model: cp_model.CpModel, 
-                            job_starts: Dict, job_machines: Dict):
-        """Add release time and due date constraints"""
-        for job in self.jobs:
-            for op_idx, operation in enumerate(job.operations):
-                compatible_machines = [m for m in self.machines if operation in m.capabilities]
-                for machine in compatible_machines:
-                    # Release time constraint
-                    model.Add(
-                        job_starts[job.job_id, op_idx, machine.machine_id] >= 0
-                    ).OnlyEnforceIf(job_machines[job.job_id, op_idx, machine.machine_id])
+    def _interchangeable_machines(self) -> List[List[int]]:
+        """Group machine indices by identical capabilities and efficiency"""
+        groups = defaultdict(list)
+        for machine_idx, machine in enumerate(self.machines):
+            groups[machine.capabilities, machine.efficiency_factor].append(machine_idx)
+        return list(groups.values())
+
+    def _add_symmetry_breaking_constraints(self, model: cp_model.CpModel, job_machines: Dict):
+        """Order interchangeable machines by the number of operations they run"""
+        # Machines with the same capabilities and efficiency can swap their
+        # workloads without changing the makespan, so only one ordering of
+        # the loads needs to be explored
+        machine_presences = [[] for _ in self.machines]
+        for (job_idx, op_idx, machine_idx), presence in job_machines.items():
+            machine_presences[machine_idx].append(presence)
+        
+        for group in self._interchangeable_machines():
+            for current_idx, next_idx in zip(group, group[1:]):
+                model.Add(
+                    sum(machine_presences[current_idx]) >= sum(machine_presences[next_idx])
+                )
 
-    def _set_objective(self, model: cp_model.CpModel, 
-                      job_ends: Dict, job_machines: Dict) -> cp_model.IntVar:
+    def _makespan_lower_bound(self) -> int:
+        """Longest job, with every operation on its fastest compatible machine"""
+        return max(
+            (sum(min(self._durations[operation, machine_idx]
+                     for machine_idx, _ in self._compat[operation])
+                 for operation in job.operations)
+             for job in self.jobs),
+            default=0
+        )
+
+    def _set_objective(self, model: cp_model.CpModel, op_ends: Dict) -> cp_model.IntVar:
         """Set up the optimization objective"""
         max_end = model.NewIntVar(0, self.horizon, 'makespan')
         
-        # Minimize makespan (completion time of last operation)
-        for job in self.jobs:
-            last_op_idx = len(job.operations) - 1
-            last_op = job.operations[last_op_idx]
-            compatible_machines = [m for m in self.machines if last_op in m.capabilities]
-            
-            for machine in compatible_machines:
-                model.Add(
-                    max_end >= job_ends[job.job_id, last_op_idx, machine.machine_id]
-                ).OnlyEnforceIf(job_machines[job.job_id, last_op_idx, machine.machine_id])
+        # Minimize makespan (completion time of last operation); with nothing
+        # to schedule the makespan is 0
+        last_ends = [
+            op_ends[job_idx, len(job.operations) - 1]
+            for job_idx, job in enumerate(self.jobs)
+            if job.operations
+        ]
+        if last_ends:
+            model.AddMaxEquality(max_end, last_ends)
+        else:
+            model.Add(max_end == 0)
+        
+        # No schedule can finish before its longest job
+        model.Add(max_end >= self._makespan_lower_bound())
         
         model.Minimize(max_end)
         return max_end
 
+    def _greedy_schedule(self) -> Optional[Dict[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Build a feasible schedule with a greedy list-scheduling heuristic
+        
+        Jobs are taken in priority order and each operation goes to the
+        compatible machine on which it finishes earliest.
+        
+        Returns:
+            Dictionary mapping (job_idx, op_idx) to (machine_idx, start_time),
+            or None if some operation has no compatible machine
+        """
+        # Encode the problem as integer arrays for the scheduling kernel
+        operations = sorted(self._compat)
+        op_types = {operation: idx for idx, operation in enumerate(operations)}
+        op_durations = np.full((len(operations), len(self.machines)), -1, dtype=np.int64)
+        for op_type, operation in enumerate(operations):
+            for machine_idx, _ in self._compat[operation]:
+                op_durations[op_type, machine_idx] = self._durations[operation, machine_idx]
+        
+        max_ops = max((len(job.operations) for job in self.jobs), default=0)
+        job_ops = np.full((len(self.jobs), max_ops), -1, dtype=np.int64)
+        for job_idx, job in enumerate(self.jobs):
+            job_ops[job_idx, :len(job.operations)] = [op_types[op] for op in job.operations]
+        
+        order = np.array(sorted(range(len(self.jobs)), key=lambda j: self.jobs[j].priority),
+                         dtype=np.int64)
+        
+        assigned, starts, feasible = greedy_list_schedule(op_durations, job_ops, order)
+        if not feasible:
+            return None
+        
+        # Relabel interchangeable machines so the heuristic respects the
+        # symmetry-breaking load order
+        loads = np.bincount(assigned[assigned >= 0], minlength=len(self.machines))
+        relabel = np.arange(len(self.machines))
+        for group in self._interchangeable_machines():
+            by_load = sorted(group, key=lambda m: loads[m], reverse=True)
+            relabel[by_load] = group
+        
+        return {
+            (job_idx, op_idx): (int(relabel[assigned[job_idx, op_idx]]),
+                                int(starts[job_idx, op_idx]))
+            for job_idx, job in enumerate(self.jobs)
+            for op_idx in range(len(job.operations))
+        }
+
+    def _add_solution_hint(self, model: cp_model.CpModel, job_machines: Dict,
+                           op_starts: Dict, op_ends: Dict, op_machines: Dict,
+                           makespan: cp_model.IntVar):
+        """Warm-start the solver with the greedy schedule"""
+        assignment = self._greedy_schedule()
+        if assignment is None:
+            return
+        
+        ends = {}
+        for job_idx, job in enumerate(self.jobs):
+            for op_idx, operation in enumerate(job.operations):
+                machine_idx, start = assignment[job_idx, op_idx]
+                ends[job_idx, op_idx] = start + self._durations[operation, machine_idx]
+        
+        greedy_makespan = max(ends.values(), default=0)
+        if greedy_makespan > self.horizon:
+            # An infeasible hint only misleads the search
+            logger.info(f"Greedy makespan {greedy_makespan} exceeds the horizon, "
+                        f"skipping warm start")
+            return
+        
+        for job_idx, job in enumerate(self.jobs):
+            for op_idx, operation in enumerate(job.operations):
+                assigned_idx, start = assignment[job_idx, op_idx]
+                for compat_idx, (machine_idx, _) in enumerate(self._compat[operation]):
+                    chosen = machine_idx == assigned_idx
+                    model.AddHint(job_machines[job_idx, op_idx, machine_idx], chosen)
+                    if chosen:
+                        model.AddHint(op_machines[job_idx, op_idx], compat_idx)
+                model.AddHint(op_starts[job_idx, op_idx], start)
+                model.AddHint(op_ends[job_idx, op_idx], ends[job_idx, op_idx])
+        model.AddHint(makespan, greedy_makespan)
+        logger.info(f"Warm start from greedy schedule with makespan {greedy_makespan}")
+
     def _calculate_operation_duration(self, operation: str, machine: Machine) -> int:
         """Calculate operation duration considering machine efficiency"""
         base_duration = get_operation_duration(operation)
         return int(base_duration / machine.efficiency_factor)
 
     def _create_schedule(self, solver: cp_model.CpSolver, 
-                        job_starts: Dict, job_ends: Dict, 
-                        job_machines: Dict, makespan: cp_model.IntVar) -> Optional[Dict]:
+                        op_starts: Dict, op_ends: Dict, 
+                        op_machines: Dict, makespan: cp_model.IntVar) -> Optional[Dict]:
         """Create the final schedule from the solver's solution"""
         schedule = {
             'jobs': [],
             'makespan': solver.Value(makespan)
         }
         
-        for job in self.jobs:
+        for job_idx, job in enumerate(self.jobs):
             job_schedule = {
                 'job_id': job.job_id,
                 'operations': []
             }
             
             for op_idx, operation in enumerate(job.operations):
-                compatible_machines = [m for m in self.machines if operation in m.capabilities]
+                compatible_machines = self._compat[operation]
+                _, machine = compatible_machines[solver.Value(op_machines[job_idx, op_idx])]
                 
-                for machine in compatible_machines:
-                    if solver.Value(job_machines[job.job_id, op_idx, machine.machine_id]):
-                        start_time = solver.Value(
-                            job_starts[job.job_id, op_idx, machine.machine_id]
-                        )
-                        end_time = solver.Value(
-                            job_ends[job.job_id, op_idx, machine.machine_id]
-                        )
-                        
-                        job_schedule['operations'].append({
-                            'operation': operation,
-                            'machine': machine.machine_id,
-                            'start_time': start_time,
-                            'end_time': end_time
-                        })
+                job_schedule['operations'].append({
+                    'operation': operation,
+                    'machine': machine.machine_id,
+                    'start_time': solver.Value(op_starts[job_idx, op_idx]),
+                    'end_time': solver.Value(op_ends[job_idx, op_idx])
+                })
             
             schedule['jobs'].append(job_schedule)
         
         return schedule
 
-    def optimize(self) -> Optional[Dict]:
-        """Main optimization method"""
-        logger.info("Starting optimization...")
+    def _create_solver(self) -> cp_model.CpSolver:
+        """Create a CP-SAT solver configured with the scheduler parameters"""
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = DEFAULT_OPTIMIZATION_TIMEOUT
+        solver.parameters.num_search_workers = self.num_workers
+        
+        if self.random_seed is not None:
+            solver.parameters.random_seed = self.random_seed
+        if self.relative_gap_limit is not None:
+            solver.parameters.relative_gap_limit = self.relative_gap_limit
+        
+        if self.log_progress:
+            # Route the search log through our logger instead of stdout
+            solver.parameters.log_search_progress = True
+            solver.parameters.log_to_stdout = False
+            solver.log_callback = logger.info
+        
+        for name, value in self.sat_params.items():
+            setattr(solver.parameters, name, value)
+        
+        return solver
+
+    def _build_lookup_tables(self):
+        """Precompute the compatible machines and durations of every operation"""
+        operations = {operation for job in self.jobs for operation in job.operations}
+        self._compat = {
+            operation: [(idx, m) for idx, m in enumerate(self.machines)
+                        if operation in m.capabilities]
+            for operation in operations
+        }
+        self._durations = {
+            (operation, machine_idx): self._calculate_operation_duration(operation, machine)
+            for machine_idx, machine in enumerate(self.machines)
+            for operation in machine.capabilities
+        }
+
+    def _build_model(self) -> Tuple[cp_model.CpModel, Dict, Dict, Dict, cp_model.IntVar]:
+        """Build the complete CP-SAT model for the current jobs and machines"""
+        self._build_lookup_tables()
         model = cp_model.CpModel()
         
         # Create variables
-        job_starts, job_ends, job_intervals, job_machines = self._create_variables(model)
+        (job_intervals, job_machines, op_starts, op_ends,
+         op_machines) = self._create_variables(model)
         
         # Add constraints
-        self._add_constraints(model, job_starts, job_ends, job_intervals, job_machines)
+        self._add_constraints(model, job_intervals, job_machines, op_starts, op_ends)
         
         # Set objective
-        makespan = self._set_objective(model, job_ends, job_machines)
+        makespan = self._set_objective(model, op_ends)
+        
+        if self.warm_start:
+            self._add_solution_hint(model, job_machines, op_starts, op_ends,
+                                    op_machines, makespan)
+        
+        return model, op_starts, op_ends, op_machines, makespan
+
+    def _check_compatibility(self) -> bool:
+        """Log every operation no machine can perform, return whether all can be scheduled"""
+        schedulable = True
+        for job in self.jobs:
+            for operation in job.operations:
+                if not any(operation in m.capabilities for m in self.machines):
+                    logger.error(f"No compatible machine for operation {operation} of job {job.job_id}")
+                    schedulable = False
+        return schedulable
+
+    def _get_model(self) -> Tuple[cp_model.CpModel, Dict, Dict, Dict, cp_model.IntVar]:
+        """Return the model for the current problem, rebuilding it only when the problem changed"""
+        key = (tuple(self.jobs), tuple(self.machines), self.horizon, self.warm_start)
+        if self._model_cache is not None and self._model_cache[0] == key:
+            logger.info("Reusing cached model")
+        else:
+            self._model_cache = (key, self._build_model())
+        return self._model_cache[1]
+
+    def optimize(self, params_override: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Main optimization method
+        
+        Args:
+            params_override: CP-SAT parameters applied on top of the scheduler
+                settings for this run only
+        """
+        logger.info("Starting optimization...")
+        if not self._check_compatibility():
+            logger.error("No solution found. Some operations have no compatible machine")
+            return None
+        
+        model, op_starts, op_ends, op_machines, makespan = self._get_model()
         
         # Solve the model
-        solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = DEFAULT_OPTIMIZATION_TIMEOUT
+        solver = self._create_solver()
+        for name, value in (params_override or {}).items():
+            setattr(solver.parameters, name, value)
         logger.info("Starting solver...")
         status = solver.Solve(model)
         
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
             logger.info(f"Solution found with status: {status}")
-            return self._create_schedule(solver, job_starts, job_ends, job_machines, makespan)
+            return self._create_schedule(solver, op_starts, op_ends, op_machines, makespan)
         else:
             logger.error(f"No solution found. Status: {status}")
             return None
 
+    def tune(self, configs: Optional[List[Dict]] = None) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Race several CP-SAT parameter sets on the same model
+        
+        Each configuration is solved concurrently on its own copy of the model
+        (CP-SAT releases the GIL while solving). The first configuration to
+        prove optimality stops the others; otherwise the best feasible
+        solution found within the time limit is kept.
+        
+        Args:
+            configs: CP-SAT parameter overrides to race, defaults to TUNING_PORTFOLIO
+            
+        Returns:
+            Tuple of the best schedule and the parameters that produced it,
+            or (None, None) if no configuration found a solution
+        """
+        configs = configs or TUNING_PORTFOLIO
+        logger.info(f"Starting parameter tuning over {len(configs)} configurations...")
+        if not self._check_compatibility():
+            logger.error("No solution found. Some operations have no compatible machine")
+            return None, None
+        
+        model, op_starts, op_ends, op_machines, makespan = self._get_model()
+        
+        # Share the worker budget between the concurrent solves
+        workers_per_config = max(1, self.num_workers // len(configs))
+        solvers = []
+        for params in configs:
+            solver = self._create_solver()
+            solver.parameters.num_search_workers = workers_per_config
+            for name, value in params.items():
+                setattr(solver.parameters, name, value)
+            solvers.append(solver)
+        
+        stop = threading.Event()
+        
+        def solve(idx: int):
+            if stop.is_set():
+                return cp_model.UNKNOWN
+            return solvers[idx].Solve(model.Clone())
+        
+        best_idx = None
+        with ThreadPoolExecutor(max_workers=len(configs)) as executor:
+            futures = {executor.submit(solve, idx): idx for idx in range(len(configs))}
+            for future in as_completed(futures):
+                idx = futures[future]
+                status = future.result()
+                if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                    continue
+                
+                # A proven optimum beats any time-limited result with the same objective
+                if best_idx is None or status == cp_model.OPTIMAL or \
+                        solvers[idx].ObjectiveValue() < solvers[best_idx].ObjectiveValue():
+                    best_idx = idx
+                
+                if status == cp_model.OPTIMAL:
+                    stop.set()
+                    for solver in solvers:
+                        solver.StopSearch()
+                    break
+        
+        if best_idx is None:
+            logger.error("No solution found by any tuning configuration")
+            return None, None
+        
+        logger.info(f"Best configuration: {configs[best_idx]} "
+                    f"(wall time {solvers[best_idx].WallTime():.2f}s)")
+        schedule = self._create_schedule(solvers[best_idx], op_starts, op_ends,
+                                         op_machines, makespan)
+        return schedule, dict(configs[best_idx])
+
     def get_schedule_statistics(self, schedule: Dict) -> Dict:
         """Calculate various statistics about the schedule"""
         if not schedule:
@@ -246,25 +538,28 @@ class ProductionScheduler:
             'machine_load': {}
         }
         
+        # Accumulate machine busy time, machine load and job spans in one pass
+        machine_time = defaultdict(int)
+        machine_ops = defaultdict(int)
+        for job in schedule['jobs']:
+            if not job['operations']:
+                continue
+            
+            start = end = None
+            for op in job['operations']:
+                machine_time[op['machine']] += op['end_time'] - op['start_time']
+                machine_ops[op['machine']] += 1
+                if start is None or op['start_time'] < start:
+                    start = op['start_time']
+                if end is None or op['end_time'] > end:
+                    end = op['end_time']
+            
+            stats['job_durations'][job['job_id']] = end - start
+        
         # Calculate machine utilization
         for machine in self.machines:
-            machine_time = 0
-            machine_ops = 0
-            for job in schedule['jobs']:
-                for op in job['operations']:
-                    if op['machine'] == machine.machine_id:
-                        machine_time += op['end_time'] - op['start_time']
-                        machine_ops += 1
-            
             stats['machine_utilization'][machine.machine_id] = \
-                (machine_time / schedule['makespan']) * 100
-            stats['machine_load'][machine.machine_id] = machine_ops
-        
-        # Calculate job durations
-        for job in schedule['jobs']:
-            if job['operations']:
-                start = min(op['start_time'] for op in job['operations'])
-                end = max(op['end_time'] for op in job['operations'])
-                stats['job_durations'][job['job_id']] = end - start
+                (machine_time[machine.machine_id] / schedule['makespan']) * 100
+            stats['machine_load'][machine.machine_id] = machine_ops[machine.machine_id]
         
         return stats
\ No newline at end of file
@@ -1,33 +1,68 @@
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 class ScheduleValidator:
     @staticmethod
-    def validate_schedule(schedule: Dict) -> Tuple[bool, List[str]]:
-        """Validate the complete schedule"""
+    def validate_schedule(schedule: Dict, fail_fast: bool = False) -> Tuple[bool, List[str]]:
+        """
+        Validate the complete schedule
+        
+        Args:
+            schedule: Dictionary containing schedule information
+            fail_fast: Stop at the first issue found
+            
+        Returns:
+            Tuple of whether the schedule is valid and the issues found
+        """
         issues = []
+        for issue in ScheduleValidator._iter_issues(schedule):
+            issues.append(issue)
+            if fail_fast:
+                break
         
+        return len(issues) == 0, issues
+
+    @staticmethod
+    def _iter_issues(schedule: Dict) -> Iterator[str]:
+        """Yield schedule issues as they are found"""
         # Check for basic schedule structure
         if not schedule or 'jobs' not in schedule:
-            issues.append("Invalid schedule format")
-            return False, issues
-            
+            yield "Invalid schedule format"
+            return
+        
+        machine_ops = []
+        
         # Validate each job's operations
         for job in schedule['jobs']:
-            if 'operations' not in job:
-                issues.append(f"Missing operations for job {job.get('job_id', 'unknown')}")
+            operations = job.get('operations')
+            if operations is None:
+                yield f"Missing operations for job {job.get('job_id', 'unknown')}"
                 continue
-                
+            
             # Check operation sequence
-            for i in range(len(job['operations']) - 1):
-                curr_op = job['operations'][i]
-                next_op = job['operations'][i + 1]
-                if curr_op['end_time'] > next_op['start_time']:
-                    issues.append(
+            prev_op = None
+            for op in operations:
+                if prev_op is not None and prev_op['end_time'] > op['start_time']:
+                    yield (
                         f"Invalid sequence in job {job['job_id']}: "
-                        f"{curr_op['operation']} ends after {next_op['operation']} starts"
+                        f"{prev_op['operation']} ends after {op['operation']} starts"
                     )
+                machine_ops.append(
+                    (op['machine'], op['start_time'], op['end_time'], job['job_id'], op['operation'])
+                )
+                prev_op = op
         
-        return len(issues) == 0, issues
\ No newline at end of file
+        # Sweep each machine's operations in start order, comparing against
+        # the operation that finishes last so far
+        machine_ops.sort()
+        latest = None
+        for op in machine_ops:
+            if latest is not None and latest[0] == op[0] and latest[2] > op[1]:
+                yield (
+                    f"Overlapping operations on machine {op[0]}: "
+                    f"{latest[3]}-{latest[4]} ends after {op[3]}-{op[4]} starts"
+                )
+            if latest is None or latest[0] != op[0] or op[2] > latest[2]:
+                latest = op
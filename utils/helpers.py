@@ -6,10 +6,14 @@ def get_operation_duration(operation: str) -> int:
     """Get the standard duration for an operation in minutes"""
     return OPERATION_DURATIONS.get(operation, 60)
 
+def default_base_date() -> datetime:
+    """Start of today's shift (08:00), the default origin of schedule minutes"""
+    return datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+
 def minutes_to_datetime(minutes: int, base_date: datetime = None) -> datetime:
     """Convert minutes to datetime"""
     if base_date is None:
-        base_date = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+        base_date = default_base_date()
     return base_date + timedelta(minutes=minutes)
 
 def datetime_to_minutes(dt: datetime, base_date: datetime = None) -> int:
@@ -1,45 +1,48 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 import plotly.figure_factory as ff
 import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
 from config.settings import GANTT_COLORS
+from utils.helpers import default_base_date
 import plotly.graph_objects as go  # Add this import for proper typing
 
-def create_gantt_chart(schedule: Dict[str, Any]) -> go.Figure:
+def create_gantt_chart(schedule: Dict[str, Any],
+                       base_date: Optional[datetime] = None) -> go.Figure:
     """
     Create a Gantt chart visualization of the schedule
     
     Args:
         schedule: Dictionary containing schedule information
+        base_date: Datetime that schedule minute 0 maps to, defaults to 08:00 today
         
     Returns:
         plotly.graph_objects.Figure: The Gantt chart figure
     """
-    df_dict = {
-        'Task': [],
-        'Start': [],
-        'Finish': [],
-        'Resource': [],
-        'Description': []
-    }
+    if base_date is None:
+        base_date = default_base_date()
+    # pd.Timestamp keeps seconds, microseconds and tzinfo of the base date
+    base = pd.Timestamp(base_date)
 
-    base_date = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+    # Flatten the schedule once, then build each column in bulk
+    operations = [(job['job_id'], op) for job in schedule['jobs'] for op in job['operations']]
+    starts_min = np.fromiter((op['start_time'] for _, op in operations),
+                             dtype=np.int64, count=len(operations))
+    ends_min = np.fromiter((op['end_time'] for _, op in operations),
+                           dtype=np.int64, count=len(operations))
 
-    # Create DataFrame for Gantt chart
-    for job in schedule['jobs']:
-        for op in job['operations']:
-            start_time = base_date + timedelta(minutes=op['start_time'])
-            end_time = base_date + timedelta(minutes=op['end_time'])
-            
-            df_dict['Task'].append(f"{job['job_id']}-{op['operation']}")
-            df_dict['Start'].append(start_time)
-            df_dict['Finish'].append(end_time)
-            df_dict['Resource'].append(op['machine'])
-            df_dict['Description'].append(
-                f"Job: {job['job_id']}<br>"
-                f"Operation: {op['operation']}<br>"
-                f"Duration: {op['end_time'] - op['start_time']} mins"
-            )
+    df_dict = {
+        'Task': [f"{job_id}-{op['operation']}" for job_id, op in operations],
+        'Start': base + starts_min.astype('timedelta64[m]'),
+        'Finish': base + ends_min.astype('timedelta64[m]'),
+        'Resource': [op['machine'] for _, op in operations],
+        'Description': [
+            f"Job: {job_id}<br>"
+            f"Operation: {op['operation']}<br>"
+            f"Duration: {op['end_time'] - op['start_time']} mins"
+            for job_id, op in operations
+        ]
+    }
 
     df = pd.DataFrame(df_dict)
     
@@ -81,15 +84,28 @@ def create_gantt_chart(schedule: Dict[str, Any]) -> go.Figure:
 
     return fig
 
-def export_schedule_figure(fig: go.Figure, filename: str = "production_schedule.html") -> None:
+def export_schedule_figure(fig: go.Figure, filename: str = "production_schedule.html",
+                           include_plotlyjs: Union[bool, str] = 'cdn') -> None:
     """
-    Export the Gantt chart to an HTML file
+    Export the Gantt chart to an HTML file, or to Plotly JSON for '.json' files
     
     Args:
         fig: The Gantt chart figure
         filename: Name of the output file
+        include_plotlyjs: How plotly.js is included in HTML output; 'cdn' links
+            it instead of embedding the ~3 MB bundle, True embeds it for
+            offline viewing
     """
-    fig.write_html(filename)
+    if filename.endswith('.json'):
+        fig.write_json(filename)
+        return
+
+    fig.write_html(
+        filename,
+        include_plotlyjs=include_plotlyjs,
+        validate=False,
+        config={'displaylogo': False}
+    )
 
 def create_utilization_chart(schedule: Dict[str, Any], 
                            machine_utilization: Dict[str, float]) -> go.Figure: